@@ -1,3 +1,4 @@
+import asyncio
 import config
 import logging
 
@@ -85,8 +86,10 @@ def post_incident():
             )
         # Create an incident based on the message using the internal path
         try:
-            resp = incident.create_incident(
-                internal=False, request_parameters=request_parameters
+            resp = asyncio.run(
+                incident.create_incident(
+                    internal=False, request_parameters=request_parameters
+                )
             )
             return (
                 jsonify({"success": True, "message": resp}),
@@ -145,8 +148,10 @@ def post_incident_ext():
             )
         # Create an incident based on the message using the internal path
         try:
-            resp = incident.create_incident(
-                internal=False, request_parameters=request_parameters
+            resp = asyncio.run(
+                incident.create_incident(
+                    internal=False, request_parameters=request_parameters
+                )
             )
             return (
                 jsonify({"success": True, "message": resp}),
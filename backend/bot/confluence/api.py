@@ -1,5 +1,6 @@
 import config
 import datetime
+import functools
 import logging
 
 from atlassian import Confluence
@@ -15,12 +16,15 @@ class ConfluenceApi:
             password=config.atlassian_api_token,
             cloud=True,
         )
-        self.today = datetime.datetime.today().strftime("%Y-%m-%d")
 
     @property
     def api(self) -> Confluence:
         return self.confluence
 
+    @property
+    def today(self) -> str:
+        return datetime.datetime.today().strftime("%Y-%m-%d")
+
     def test(self) -> bool:
         try:
             return self.confluence.page_exists(
@@ -36,3 +40,9 @@ class ConfluenceApi:
             logger.error(
                 f"Please check Confluence configuration and try again."
             )
+
+
+@functools.lru_cache(maxsize=1)
+def get_confluence_api() -> ConfluenceApi:
+    """Return the ConfluenceApi shared by RCA and template creation"""
+    return ConfluenceApi()
@@ -1,6 +1,6 @@
 import config
 
-from bot.confluence.api import ConfluenceApi, logger
+from bot.confluence.api import get_confluence_api, logger
 from bot.models.pg import IncidentLogging
 from bot.shared import tools
 from bot.templates.confluence.rca import RCATemplate
@@ -37,7 +37,7 @@ class IncidentRootCauseAnalysis:
             .get("space")
         )
 
-        self.confluence = ConfluenceApi()
+        self.confluence = get_confluence_api()
         self.exec = self.confluence.api
         self.today = self.confluence.today
 
@@ -192,13 +192,7 @@ class IncidentRootCauseAnalysis:
             "timeline": timeline,
             "pinned_messages": pinned_messages,
         }
-        return RCATemplate.template(
-            incident_commander=incident_commander,
-            severity=severity,
-            severity_definition=severity_definition,
-            timeline=timeline,
-            pinned_messages=pinned_messages,
-        )
+        return RCATemplate.template(**variables)
 
     def __user_mention_format(self, role: str) -> str:
         """
@@ -1,10 +1,10 @@
 import config
 
-from bot.confluence.api import ConfluenceApi, logger
+from bot.confluence.api import get_confluence_api, logger
 
 template_name = "Incident RCA Template"
 
-api = ConfluenceApi()
+api = get_confluence_api()
 
 tplid = next(
     item
@@ -4,18 +4,18 @@ import datetime
 import logging
 import re
 import slack_sdk.errors
+import threading
 
 from bot.audit import log
 from bot.exc import ConfigurationError
 from bot.models.incident import (
-    db_update_incident_created_at_col,
     db_update_incident_sp_ts_col,
     db_write_incident,
 )
 from bot.models.pager import read_pager_auto_page_targets
 from bot.shared import tools
 from bot.slack.client import (
-    all_workspace_groups,
+    get_usergroup_members,
     slack_web_client,
     slack_workspace_id,
 )
@@ -27,6 +27,7 @@ from bot.templates.incident.digest_notification import (
     IncidentChannelDigestNotification,
 )
 from bot.zoom.meeting import ZoomMeeting
+from cachetools import TTLCache
 from cerberus import Validator
 from typing import Any, Dict, List
 
@@ -36,14 +37,136 @@ logger = logging.getLogger("incident.handler")
 # Slack has a max char limit of 80, but when creating the RCA channel, we need 4 extra chars for '-rca'
 # Limit the channel name to 76 to take this into account
 channel_name_length_cap = 76
+# Incident channels are named inc-<creation time>-<description>
+channel_name_prefix_fmt = "inc-%Y%m%d%H%M-"
 # How many characters does the incident prefix take up?
-channel_name_prefix_length = len("inc-20211116-")
+channel_name_prefix_length = len("inc-202111161200-")
 # How long can the provided description be?
 incident_description_max_length = channel_name_length_cap - channel_name_prefix_length
+# Characters not allowed in the description part of the channel name
+channel_name_suffix_disallowed = re.compile(r"[^A-Za-z0-9\s]")
 
 if not config.is_test_environment:
     from bot.slack.client import invite_user_to_channel
 
+# Request parameters are validated against a single compiled schema.
+# A Validator keeps per-call state, so it is shared under a lock.
+request_parameters_schema = {
+    "channel": {
+        "required": True,
+        "type": "string",
+        "empty": False,
+    },
+    "incident_description": {
+        "required": True,
+        "type": "string",
+        "empty": False,
+    },
+    "user": {
+        "required": False,
+        "type": "string",
+    },
+    "severity": {
+        "required": True,
+        "type": "string",
+        "empty": False,
+    },
+    "created_from_web": {
+        "required": True,
+        "type": "boolean",
+        "empty": False,
+    },
+    "is_security_incident": {
+        "required": True,
+        "type": "boolean",
+        "empty": False,
+    },
+    "private_channel": {
+        "required": True,
+        "type": "boolean",
+        "empty": False,
+    },
+    "message_reacted_to_content": {
+        "required": False,
+        "type": "string",
+    },
+    "original_message_timestamp": {
+        "required": False,
+        "type": "string",
+    },
+}
+request_parameters_validator_lock = threading.Lock()
+
+
+def reload_config():
+    """Read the options and severities used when creating incidents from
+    config.active
+
+    These don't change for the life of the process, so they are read
+    once at import. Call this again if config.active is replaced.
+    """
+    global auto_invite_enabled, auto_invite_groups
+    global channel_topic_default, channel_topic_set_to_meeting_link
+    global conference_bridge_link, create_from_reaction_enabled
+    global pagerduty_enabled, statuspage_enabled, zoom_auto_create_meeting
+    global request_parameters_validator
+
+    options = config.active.options
+    integrations = config.active.integrations
+    auto_invite_enabled = options.get("auto_invite_groups").get("enabled")
+    auto_invite_groups = options.get("auto_invite_groups").get("groups")
+    channel_topic_default = options.get("channel_topic").get("default")
+    channel_topic_set_to_meeting_link = options.get("channel_topic").get(
+        "set_to_meeting_link"
+    )
+    conference_bridge_link = options.get("conference_bridge_link")
+    create_from_reaction_enabled = options.get("create_from_reaction").get(
+        "enabled"
+    )
+    pagerduty_enabled = "pagerduty" in integrations
+    statuspage_enabled = "statuspage" in integrations
+    zoom_auto_create_meeting = "zoom" in integrations and integrations.get(
+        "zoom"
+    ).get("auto_create_meeting", False)
+    # Severities are checked against the configured ones
+    with request_parameters_validator_lock:
+        request_parameters_schema["severity"]["allowed"] = list(
+            config.active.severities.keys()
+        )
+        request_parameters_validator = Validator(request_parameters_schema)
+
+
+reload_config()
+
+# Static leading blocks of messages posted to every new incident channel,
+# built once and shared since Slack only serializes them
+conference_bridge_header_blocks = (
+    {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": ":busts_in_silhouette: Please join the conference here.",
+        },
+    },
+    {"type": "divider"},
+)
+created_from_reaction_header_blocks = (
+    {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": ":warning: This incident was created via a reaction to a message.",
+        },
+    },
+    {"type": "divider"},
+)
+
+# Messages that recently had an incident created from them, keyed by
+# (channel, message timestamp), so that redelivered or repeated Slack
+# events for the same message don't open a second incident channel
+recent_message_incidents = TTLCache(maxsize=256, ttl=300)
+recent_message_incidents_lock = threading.Lock()
+
 
 class RequestParameters:
     def __init__(
@@ -88,58 +211,19 @@ class RequestParameters:
 
         Returns bool indicating whether or not the service passes validation
         """
-        schema = {
-            "channel": {
-                "required": True,
-                "type": "string",
-                "empty": False,
-            },
-            "incident_description": {
-                "required": True,
-                "type": "string",
-                "empty": False,
-            },
-            "user": {
-                "required": False,
-                "type": "string",
-            },
-            "severity": {
-                "required": True,
-                "type": "string",
-                "allowed": [key for key, _ in config.active.severities.items()],
-                "empty": False,
-            },
-            "created_from_web": {
-                "required": True,
-                "type": "boolean",
-                "empty": False,
-            },
-            "is_security_incident": {
-                "required": True,
-                "type": "boolean",
-                "empty": False,
-            },
-            "private_channel": {
-                "required": True,
-                "type": "boolean",
-                "empty": False,
-            },
-            "message_reacted_to_content": {
-                "required": False,
-                "type": "string",
-            },
-            "original_message_timestamp": {
-                "required": False,
-                "type": "string",
-            },
-        }
-        v = Validator(schema)
-        if not v.validate(self.as_dict, schema):
-            raise ConfigurationError(f"Request parameters has errors: {v.errors}")
+        with request_parameters_validator_lock:
+            if not request_parameters_validator.validate(self.as_dict):
+                raise ConfigurationError(
+                    f"Request parameters has errors: {request_parameters_validator.errors}"
+                )
 
 
 class Incident:
-    """Instantiates an incident"""
+    """Instantiates an incident
+
+    Construction does no I/O; call provision() to create the Slack
+    channel and conference link
+    """
 
     def __init__(self, request_parameters: RequestParameters):
         self.request_parameters = request_parameters
@@ -148,18 +232,15 @@ class Incident:
         # Set instance variables
         self.incident_description = self.request_parameters.incident_description
         self.channel_name = self.__format_channel_name()
-        if not config.is_test_environment:
-            self.channel = self.__create_incident_channel()
-            self.channel_details = self.channel.get("channel")
-            self.created_channel_details = {
-                "incident_description": self.request_parameters.incident_description,
-                "id": self.channel_details.get("id"),
-                "name": self.channel_details.get("name"),
-                "is_security_incident": self.request_parameters.is_security_incident,
-                "private_channel": self.request_parameters.private_channel,
-            }
-            self.conference_bridge = self.__generate_conference_link()
-        else:
+
+    async def provision(self):
+        """
+        Create the incident channel and conference link
+
+        The channel is created first so that a failure (e.g. name_taken)
+        does not leave behind a conference meeting nobody will use
+        """
+        if config.is_test_environment:
             self.channel_details = {}
             self.created_channel_details = {
                 "name": self.channel_details.get("name"),
@@ -167,6 +248,19 @@ class Incident:
                 "private_channel": False,
             }
             self.conference_bridge = "mock"
+            return
+        self.channel = await asyncio.to_thread(self.__create_incident_channel)
+        self.conference_bridge = await asyncio.to_thread(
+            self.__generate_conference_link
+        )
+        self.channel_details = self.channel.get("channel")
+        self.created_channel_details = {
+            "incident_description": self.request_parameters.incident_description,
+            "id": self.channel_details.get("id"),
+            "name": self.channel_details.get("name"),
+            "is_security_incident": self.request_parameters.is_security_incident,
+            "private_channel": self.request_parameters.private_channel,
+        }
 
     def log(self):
         request_log = {
@@ -175,7 +269,8 @@ class Incident:
             "incident_description": self.request_parameters.incident_description,
         }
         logger.info(
-            f"Request received from Slack to start a new incident: {request_log}"
+            "Request received from Slack to start a new incident: %s",
+            request_log,
         )
 
     def __create_incident_channel(self):
@@ -191,16 +286,15 @@ class Incident:
                 is_private=self.request_parameters.private_channel,
             )
             # Log the result which includes information like the ID of the conversation
-            logger.debug(f"\n{channel}\n")
-            logger.info(f"Creating incident channel: {self.channel_name}")
+            logger.debug("\n%s\n", channel)
+            logger.info("Creating incident channel: %s", self.channel_name)
         except slack_sdk.errors.SlackApiError as error:
-            logger.error(f"Error creating incident channel: {error}")
+            logger.error("Error creating incident channel: %s", error)
         return channel
 
     def __format_channel_name(self) -> str:
         # Remove any special characters (allow only alphanumeric)
-        formatted_channel_name_suffix = re.sub(
-            "[^A-Za-z0-9\s]",
+        formatted_channel_name_suffix = channel_name_suffix_disallowed.sub(
             "",
             self.incident_description,
         )
@@ -209,15 +303,16 @@ class Incident:
             " ", "-"
         ).lower()
         now = datetime.datetime.now()
-        return f"inc-{now.year}{now.month}{now.day}{now.hour}{now.minute}-{formatted_channel_name_suffix}"
+        return (
+            now.strftime(channel_name_prefix_fmt)
+            + formatted_channel_name_suffix
+        )
 
     def __generate_conference_link(self):
-        if "zoom" in config.active.integrations and config.active.integrations.get(
-            "zoom"
-        ).get("auto_create_meeting", False):
+        if zoom_auto_create_meeting:
             return ZoomMeeting().url
         else:
-            return config.active.options.get("conference_bridge_link")
+            return conference_bridge_link
 
 
 """
@@ -225,7 +320,7 @@ Core Functionality
 """
 
 
-def create_incident(
+async def create_incident(
     request_parameters: RequestParameters,
     internal: bool = False,
 ) -> str:
@@ -234,159 +329,189 @@ def create_incident(
     """
     incident_description = request_parameters.incident_description
     user = request_parameters.user
-    severity = request_parameters.severity
-    if incident_description != "":
-        if len(incident_description) < incident_description_max_length:
-            incident = Incident(request_parameters)
-            created_channel_details = incident.created_channel_details
-            """
-            Notify incidents digest channel
-            """
-            try:
-                digest_message = slack_web_client.chat_postMessage(
-                    **IncidentChannelDigestNotification.create(
-                        incident_channel_details=created_channel_details,
-                        conference_bridge=incident.conference_bridge,
-                        severity=severity,
-                    ),
-                    text="New Incident",
-                )
-                logger.debug(f"\n{digest_message}\n")
-            except slack_sdk.errors.SlackApiError as error:
-                logger.error(
-                    f"Error sending message to incident digest channel: {error}"
-                )
-            logger.info(
-                "Sending message to digest channel for: {}".format(
-                    created_channel_details["name"]
-                )
-            )
-            """
-            Set incident channel topic
-            """
-            topic_boilerplate = (
-                incident.conference_bridge
-                if config.active.options.get("channel_topic").get("set_to_meeting_link")
-                else config.active.options.get("channel_topic").get("default")
-            )
-            try:
-                topic = slack_web_client.conversations_setTopic(
-                    channel=created_channel_details["id"],
-                    topic=topic_boilerplate,
-                )
-                logger.debug(f"\n{topic}\n")
-            except slack_sdk.errors.SlackApiError as error:
-                logger.error(f"Error setting incident channel topic: {error}")
-            """
-            Send boilerplate info to incident channel
-            """
-            try:
-                bp_message = slack_web_client.chat_postMessage(
-                    **IncidentChannelBoilerplateMessage.create(
-                        incident_channel_details=created_channel_details,
-                        severity=severity,
-                    ),
-                    text="Details",
+    # Reject bad descriptions before any Slack calls are made
+    if incident_description == "":
+        return "Please provide a description for the channel."
+    if len(incident_description) > incident_description_max_length:
+        return f"Total channel length cannot exceed 80 characters. Please use a short description of at most {incident_description_max_length} characters. You used {len(incident_description)}."
+    key = None
+    if request_parameters.original_message_timestamp:
+        key = (
+            request_parameters.channel,
+            request_parameters.original_message_timestamp,
+        )
+        with recent_message_incidents_lock:
+            if key in recent_message_incidents:
+                logger.info(
+                    "Skipping duplicate request to create an incident from message %s",
+                    key,
                 )
-                logger.debug(f"\n{bp_message}\n")
-            except slack_sdk.errors.SlackApiError as error:
-                logger.error(f"Error sending message to incident channel: {error}")
-            # Pin the boilerplate message to the channel for quick access.
-            slack_web_client.pins_add(
+                return "An incident has already been created for that message."
+            recent_message_incidents[key] = True
+
+    incident = Incident(request_parameters)
+    try:
+        await incident.provision()
+    except Exception:
+        # No channel was created, so the message may be tried again
+        if key is not None:
+            with recent_message_incidents_lock:
+                recent_message_incidents.pop(key, None)
+        raise
+    created_channel_details = incident.created_channel_details
+
+    await initialize_incident(incident=incident, internal=internal)
+
+    # Invite the user who opened the channel to the channel.
+    invite_user_to_channel(created_channel_details["id"], user)
+    # Return for view method
+    temp_channel_id = created_channel_details["id"]
+
+    # Write audit log
+    log.write(
+        incident_id=created_channel_details["name"],
+        event="Incident created.",
+        user=user,
+    )
+    return f"I've created the incident channel: <#{temp_channel_id}>"
+
+
+async def call_slack(error_message: str, method, **kwargs):
+    """
+    Run a blocking Slack Web API method in a worker thread so that
+    independent calls can be awaited together
+
+    Errors are logged using error_message and None is returned
+    """
+    try:
+        resp = await asyncio.to_thread(method, **kwargs)
+        logger.debug("\n%s\n", resp)
+        return resp
+    except slack_sdk.errors.SlackApiError as error:
+        logger.error("%s: %s", error_message, error)
+
+
+async def initialize_incident(incident: Incident, internal: bool = False):
+    """
+    Post the initial messages for a newly created incident channel,
+    record the incident and handle optional features
+    """
+    request_parameters = incident.request_parameters
+    severity = request_parameters.severity
+    created_channel_details = incident.created_channel_details
+    topic_boilerplate = (
+        incident.conference_bridge
+        if channel_topic_set_to_meeting_link
+        else channel_topic_default
+    )
+    """
+    Notify incidents digest channel, set incident channel topic, send
+    boilerplate info and conference link to incident channel
+
+    The digest message and topic don't depend on anything else, so they
+    are sent while the incident channel messages are posted. The channel
+    messages are posted and pinned in order so that they always appear the
+    same way
+    """
+
+    async def post_channel_messages():
+        bp_message = await call_slack(
+            "Error sending message to incident channel",
+            slack_web_client.chat_postMessage,
+            **IncidentChannelBoilerplateMessage.create(
+                incident_channel_details=created_channel_details,
+                severity=severity,
+            ),
+            text="Details",
+        )
+        conference_bridge_message = await call_slack(
+            "Error sending conference bridge link to channel",
+            slack_web_client.chat_postMessage,
+            channel=created_channel_details["id"],
+            text=f":busts_in_silhouette: Please join the conference here: {incident.conference_bridge}",
+            blocks=[
+                *conference_bridge_header_blocks,
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"{incident.conference_bridge}",
+                    },
+                },
+            ],
+        )
+        # Pin the boilerplate message and conference link for quick access.
+        if bp_message:
+            await call_slack(
+                "Error pinning boilerplate message",
+                slack_web_client.pins_add,
                 channel=created_channel_details["id"],
                 timestamp=bp_message["ts"],
             )
-            """
-            Post conference link in the channel upon creation
-            """
-            try:
-                conference_bridge_message = slack_web_client.chat_postMessage(
-                    channel=created_channel_details["id"],
-                    text=f":busts_in_silhouette: Please join the conference here: {incident.conference_bridge}",
-                    blocks=[
-                        {
-                            "type": "header",
-                            "text": {
-                                "type": "plain_text",
-                                "text": ":busts_in_silhouette: Please join the conference here.",
-                            },
-                        },
-                        {"type": "divider"},
-                        {
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": f"{incident.conference_bridge}",
-                            },
-                        },
-                    ],
-                )
-                slack_web_client.pins_add(
-                    channel=created_channel_details["id"],
-                    timestamp=conference_bridge_message["message"]["ts"],
-                )
-            except slack_sdk.errors.SlackApiError as error:
-                logger.error(
-                    f"Error sending conference bridge link to channel: {error}"
-                )
-            """
-            Write incident entry to database
-            """
-            logger.info(
-                "Writing incident entry to database for {}...".format(
-                    created_channel_details["name"]
-                )
-            )
-            try:
-                db_write_incident(
-                    incident_id=created_channel_details["name"],
-                    channel_id=created_channel_details["id"],
-                    channel_name=created_channel_details["name"],
-                    status="investigating",
-                    severity=severity,
-                    bp_message_ts=bp_message["ts"],
-                    dig_message_ts=digest_message["ts"],
-                    is_security_incident=created_channel_details[
-                        "is_security_incident"
-                    ],
-                    channel_description=created_channel_details["incident_description"],
-                    conference_bridge=incident.conference_bridge,
-                )
-            except Exception as error:
-                logger.fatal(f"Error writing entry to database: {error}")
-            # Tag the incident with initial creation timestamp in human readable format
-            try:
-                db_update_incident_created_at_col(
-                    incident_id=created_channel_details["name"],
-                    created_at=tools.fetch_timestamp(),
-                )
-            except Exception as error:
-                logger.fatal(
-                    f"Error updating incident entry with creation timestamp: {error}"
-                )
-
-            asyncio.run(
-                handle_incident_optional_features(
-                    request_parameters, created_channel_details, internal
-                )
+        if conference_bridge_message:
+            await call_slack(
+                "Error pinning conference bridge link",
+                slack_web_client.pins_add,
+                channel=created_channel_details["id"],
+                timestamp=conference_bridge_message["message"]["ts"],
             )
+        return bp_message
 
-            # Invite the user who opened the channel to the channel.
-            invite_user_to_channel(created_channel_details["id"], user)
-            # Return for view method
-            temp_channel_id = created_channel_details["id"]
+    logger.info(
+        "Sending message to digest channel for: %s",
+        created_channel_details["name"],
+    )
+    digest_message, _, bp_message = await asyncio.gather(
+        call_slack(
+            "Error sending message to incident digest channel",
+            slack_web_client.chat_postMessage,
+            **IncidentChannelDigestNotification.create(
+                incident_channel_details=created_channel_details,
+                conference_bridge=incident.conference_bridge,
+                severity=severity,
+            ),
+            text="New Incident",
+        ),
+        call_slack(
+            "Error setting incident channel topic",
+            slack_web_client.conversations_setTopic,
+            channel=created_channel_details["id"],
+            topic=topic_boilerplate,
+        ),
+        post_channel_messages(),
+    )
+    """
+    Write incident entry to database
+    """
+    logger.info(
+        "Writing incident entry to database for %s...",
+        created_channel_details["name"],
+    )
+    try:
+        db_write_incident(
+            incident_id=created_channel_details["name"],
+            channel_id=created_channel_details["id"],
+            channel_name=created_channel_details["name"],
+            status="investigating",
+            severity=severity,
+            bp_message_ts=bp_message["ts"],
+            dig_message_ts=digest_message["ts"],
+            is_security_incident=created_channel_details[
+                "is_security_incident"
+            ],
+            channel_description=created_channel_details[
+                "incident_description"
+            ],
+            conference_bridge=incident.conference_bridge,
+            # Initial creation timestamp in human readable format
+            created_at=tools.fetch_timestamp(),
+        )
+    except Exception:
+        logger.exception("Error writing entry to database")
 
-            # Write audit log
-            log.write(
-                incident_id=created_channel_details["name"],
-                event="Incident created.",
-                user=user,
-            )
-            return f"I've created the incident channel: <#{temp_channel_id}>"
-        else:
-            return f"Total channel length cannot exceed 80 characters. Please use a short description less than {incident_description_max_length} characters. You used {len(incident_description)}."
-    else:
-        return "Please provide a description for the channel."
+    await handle_incident_optional_features(
+        request_parameters, created_channel_details, internal
+    )
 
 
 async def handle_incident_optional_features(
@@ -403,45 +528,53 @@ async def handle_incident_optional_features(
     """
     Invite required participants (optional)
     """
-    if config.active.options.get("auto_invite_groups").get("enabled"):
-        for gr in config.active.options.get("auto_invite_groups").get("groups"):
-            all_groups = all_workspace_groups.get("usergroups")
-            if len(all_groups) == 0:
+    if auto_invite_enabled:
+        # Look up all groups at once and invite their members in one call
+        group_members = await asyncio.gather(
+            *[
+                asyncio.to_thread(get_usergroup_members, gr)
+                for gr in auto_invite_groups
+            ],
+            return_exceptions=True,
+        )
+        invited_groups = []
+        required_participants = set()
+        for gr, members in zip(auto_invite_groups, group_members):
+            if isinstance(members, Exception):
+                logger.error(
+                    "Error when formatting automatic invitees group name: %s",
+                    members,
+                )
+            elif len(members) == 0:
                 logger.error(
-                    f"Error when inviting mandatory users: looked for group {gr} but did not find it."
+                    "Error when inviting mandatory users: looked for group %s but did not find it.",
+                    gr,
                 )
             else:
-                try:
-                    required_participants_group = [
-                        g for g in all_groups if g["handle"] == gr
-                    ][0]["id"]
-                    required_participants_group_members = (
-                        slack_web_client.usergroups_users_list(
-                            usergroup=required_participants_group,
-                        )
-                    )["users"]
-                except Exception as error:
-                    logger.error(
-                        f"Error when formatting automatic invitees group name: {error}"
-                    )
-                try:
-                    invite = slack_web_client.conversations_invite(
-                        channel=channel_id,
-                        users=",".join(required_participants_group_members),
-                    )
-                    logger.debug(f"\n{invite}\n")
-                    # Write audit log
-                    log.write(
-                        incident_id=created_channel_details["name"],
-                        event=f"Group {gr} invited to the incident channel automatically.",
-                    )
-                except slack_sdk.errors.SlackApiError as error:
-                    logger.error(f"Error when inviting auto users: {error}")
+                invited_groups.append(gr)
+                required_participants.update(members)
+        if required_participants:
+            try:
+                invite = slack_web_client.conversations_invite(
+                    channel=channel_id,
+                    users=",".join(sorted(required_participants)),
+                    # Invite everyone who can be invited instead of failing
+                    # the whole call over a single guest or restricted user
+                    force=True,
+                )
+                logger.debug("\n%s\n", invite)
+                # Write audit log
+                log.write(
+                    incident_id=created_channel_details["name"],
+                    event=f"Groups {', '.join(invited_groups)} invited to the incident channel automatically.",
+                )
+            except slack_sdk.errors.SlackApiError as error:
+                logger.error("Error when inviting auto users: %s", error)
 
     """
     Post prompt for creating Statuspage incident if enabled
     """
-    if "statuspage" in config.active.integrations:
+    if statuspage_enabled:
         sp_starter_message_content = return_new_statuspage_incident_message(channel_id)
         try:
             sp_starter_message = slack_web_client.chat_postMessage(
@@ -454,9 +587,11 @@ async def handle_incident_optional_features(
             )
         except slack_sdk.errors.SlackApiError as error:
             logger.error(
-                f"Error sending Statuspage prompt to the incident channel {channel_name}: {error}"
+                "Error sending Statuspage prompt to the incident channel %s: %s",
+                channel_name,
+                error,
             )
-        logger.info(f"Sending Statuspage prompt to {channel_name}.")
+        logger.info("Sending Statuspage prompt to %s.", channel_name)
         # Update incident record with the Statuspage starter message timestamp
         logger.info(
             "Updating incident record in database with Statuspage message timestamp."
@@ -466,13 +601,13 @@ async def handle_incident_optional_features(
                 incident_id=channel_name,
                 ts=sp_starter_message["ts"],
             )
-        except Exception as error:
-            logger.fatal(f"Error writing entry to database: {error}")
+        except Exception:
+            logger.exception("Error writing entry to database")
 
     """
     If this is an internal incident, parse additional values
     """
-    if internal and config.active.options.get("create_from_reaction").get("enabled"):
+    if internal and create_from_reaction_enabled:
         original_channel = request_parameters.channel
         original_message_timestamp = request_parameters.original_message_timestamp
         formatted_timestamp = str.replace(original_message_timestamp, ".", "")
@@ -482,14 +617,7 @@ async def handle_incident_optional_features(
                 channel=channel_id,
                 text=f":warning: This incident was created via a reaction to a message. Here is a link to the original message: <{link_to_message}>",
                 blocks=[
-                    {
-                        "type": "header",
-                        "text": {
-                            "type": "plain_text",
-                            "text": ":warning: This incident was created via a reaction to a message.",
-                        },
-                    },
-                    {"type": "divider"},
+                    *created_from_reaction_header_blocks,
                     {
                         "type": "section",
                         "text": {
@@ -501,9 +629,11 @@ async def handle_incident_optional_features(
             )
         except slack_sdk.errors.SlackApiError as error:
             logger.error(
-                f"Error sending additional information to the incident channel {channel_name}: {error}"
+                "Error sending additional information to the incident channel %s: %s",
+                channel_name,
+                error,
             )
-        logger.info(f"Sending additional information to {channel_name}.")
+        logger.info("Sending additional information to %s.", channel_name)
         # Message the channel where the react request came from to inform
         # regarding incident channel creation
         try:
@@ -522,28 +652,39 @@ async def handle_incident_optional_features(
             )
         except slack_sdk.errors.SlackApiError as error:
             logger.error(
-                f"Error when trying to let {channel_name} know about an auto created incident: {error}"
+                "Error when trying to let %s know about an auto created incident: %s",
+                channel_name,
+                error,
             )
     """
     Page groups that are required to be automatically paged (optional)
     """
-    if "pagerduty" in config.active.integrations:
+    if pagerduty_enabled:
         from bot.pagerduty import api as pd_api
 
         auto_page_targets = read_pager_auto_page_targets()
         if len(auto_page_targets) != 0:
-            for i in auto_page_targets:
-                for k, v in i.items():
-                    logger.info(f"Paging {k}...")
-                    # Write audit log
-                    log.write(
-                        incident_id=created_channel_details["name"],
-                        event=f"Created PagerDuty incident for team {k}.",
-                    )
-                    pd_api.page(
+            # A team listed more than once is still only paged once
+            targets = sorted(
+                {(k, v) for i in auto_page_targets for k, v in i.items()}
+            )
+            for k, _ in targets:
+                logger.info("Paging %s...", k)
+                # Write audit log
+                log.write(
+                    incident_id=created_channel_details["name"],
+                    event=f"Created PagerDuty incident for team {k}.",
+                )
+            await asyncio.gather(
+                *[
+                    asyncio.to_thread(
+                        pd_api.page,
                         ep_name=v,
                         priority="low",
                         channel_name=created_channel_details["name"],
                         channel_id=created_channel_details["id"],
                         paging_user="auto",
                     )
+                    for _, v in targets
+                ]
+            )
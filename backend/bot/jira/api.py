@@ -1,4 +1,5 @@
 import config
+import functools
 import logging
 
 from atlassian import Jira
@@ -14,6 +15,11 @@ class JiraApi:
             password=config.atlassian_api_token,
             cloud=True,
         )
+        self.project = (
+            config.active.integrations.get("atlassian")
+            .get("jira")
+            .get("project")
+        )
 
     @property
     def api(self) -> Jira:
@@ -21,11 +27,13 @@ class JiraApi:
 
     def test(self) -> bool:
         try:
-            return self.jira.get_project(
-                config.active.integrations.get("atlassian")
-                .get("jira")
-                .get("project")
-            ).get("id")
+            return self.jira.get_project(self.project).get("id")
         except Exception as error:
-            logger.error(f"Error authenticating to Jira: {error}")
-            logger.error(f"Please check Jira configuration and try again.")
+            logger.error("Error authenticating to Jira: %s", error)
+            logger.error("Please check Jira configuration and try again.")
+
+
+@functools.lru_cache(maxsize=1)
+def get_jira_api() -> JiraApi:
+    """Return the JiraApi shared by every JiraIssue"""
+    return JiraApi()
@@ -1,8 +1,21 @@
 import config
 import requests
+import threading
+import time
 
-from bot.jira.api import JiraApi, logger
+from atlassian import Jira
+from bot.jira.api import get_jira_api, logger
 from bot.models.incident import db_read_incident
+from typing import Any, Dict, List
+
+# Jira priorities rarely change, so the list is reused between issues
+# and only refreshed once it is older than priorities_cache_ttl seconds
+priorities_cache_ttl = 3600
+_priorities_cache: Dict[str, Any] = {"data": [], "expires": 0.0}
+
+# Project key -> project ID, resolved once per process
+_project_ids: Dict[str, str] = {}
+_project_ids_lock = threading.Lock()
 
 
 class JiraIssue:
@@ -14,7 +27,7 @@ class JiraIssue:
         priority: str,
         summary: str,
     ):
-        self.jira = JiraApi()
+        self.jira = get_jira_api()
         self.exec = self.jira.api
         self.incident_id = incident_id
         self.incident_data = db_read_incident(channel_id=self.incident_id)
@@ -27,11 +40,7 @@ class JiraIssue:
             .get("labels")
         ) + [self.incident_data.channel_name]
         self.priority = priority
-        self.project_id = self.exec.project(
-            config.active.integrations.get("atlassian")
-            .get("jira")
-            .get("project")
-        ).get("id")
+        self.project_id = get_project_id(self.exec, self.jira.project)
         self.summary = summary
 
     def new(self):
@@ -55,7 +64,7 @@ class JiraIssue:
     def __get_priority_id(self, priority: str):
         """Returns a priority id by name"""
         try:
-            resp = self.exec.get_all_priorities()
+            resp = get_all_priorities(self.exec)
             return next(
                 (
                     pr.get("id")
@@ -67,3 +76,32 @@ class JiraIssue:
             )
         except requests.exceptions.HTTPError as error:
             logger.error(f"Error finding Jira priority ID: {error}")
+
+
+def get_project_id(jira: Jira, project: str) -> str:
+    """Returns the ID of a Jira project, looking it up only on first use"""
+    with _project_ids_lock:
+        if project not in _project_ids:
+            _project_ids[project] = jira.project(project).get("id")
+        return _project_ids[project]
+
+
+def get_all_priorities(jira: Jira) -> List[Dict[str, Any]]:
+    """Returns all Jira priorities, serving a cached copy when possible
+
+    If refreshing an expired copy fails, the stale copy is returned
+    instead of raising
+    """
+    now = time.monotonic()
+    if _priorities_cache["data"] and now < _priorities_cache["expires"]:
+        return _priorities_cache["data"]
+    try:
+        _priorities_cache["data"] = jira.get_all_priorities()
+        _priorities_cache["expires"] = now + priorities_cache_ttl
+    except requests.exceptions.HTTPError as error:
+        if not _priorities_cache["data"]:
+            raise
+        logger.error(
+            f"Error refreshing Jira priorities, using cached copy: {error}"
+        )
+    return _priorities_cache["data"]
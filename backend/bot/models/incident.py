@@ -457,6 +457,7 @@ def db_write_incident(
     is_security_incident,
     channel_description,
     conference_bridge,
+    created_at=None,
 ):
     """
     Write incident entry to database
@@ -472,6 +473,7 @@ def db_write_incident(
         is_security_incident - Whether or not the incident is security-focused
         channel_description - Unformatted original description
         conference_bridge - Link to conference bridge
+        created_at - Human readable creation timestamp
     """
     try:
         incident = Incident(
@@ -485,6 +487,7 @@ def db_write_incident(
             is_security_incident=is_security_incident,
             channel_description=channel_description,
             conference_bridge=conference_bridge,
+            created_at=created_at,
         )
         Session.add(incident)
         Session.commit()
@@ -1,6 +1,7 @@
 import config
 import json
 import logging
+import threading
 
 from bot.models.pg import Incident, OperationalData, Session
 from bot.shared import tools
@@ -31,6 +32,10 @@ class PagerDutyAPI:
 
 session = PagerDutyAPI().session()
 
+# Serializes updates to an incident's list of PagerDuty incidents when
+# several teams are paged at once
+incident_update_lock = threading.Lock()
+
 """
 PagerDuty
 """
@@ -151,29 +156,30 @@ def page(
             raise Exception(
                 "Error creating PagerDuty incident: {}".format(response.json())
             )
-        try:
-            created_incident = json.loads(response.text)["incident"]
-            incident = (
-                Session.query(Incident)
-                .filter_by(incident_id=channel_name)
-                .one()
-            )
-            existing_incidents = incident.pagerduty_incidents
-            if existing_incidents is None:
-                existing_incidents = [created_incident["id"]]
-            else:
-                existing_incidents.append(created_incident["id"])
-                Session.execute(
-                    update(Incident)
-                    .where(Incident.incident_id == channel_name)
-                    .values(pagerduty_incidents=existing_incidents)
+        with incident_update_lock:
+            try:
+                created_incident = json.loads(response.text)["incident"]
+                incident = (
+                    Session.query(Incident)
+                    .filter_by(incident_id=channel_name)
+                    .one()
                 )
-                Session.commit()
-        except Exception as error:
-            logger.error(f"Error updating incident: {error}")
-        finally:
-            Session.close()
-            Session.remove()
+                existing_incidents = incident.pagerduty_incidents
+                if existing_incidents is None:
+                    existing_incidents = [created_incident["id"]]
+                else:
+                    existing_incidents.append(created_incident["id"])
+                    Session.execute(
+                        update(Incident)
+                        .where(Incident.incident_id == channel_name)
+                        .values(pagerduty_incidents=existing_incidents)
+                    )
+                    Session.commit()
+            except Exception as error:
+                logger.error(f"Error updating incident: {error}")
+            finally:
+                Session.close()
+                Session.remove()
     except PDClientError as error:
         logger.error(f"Error creating PagerDuty incident: {error}")
 
@@ -1,41 +1,44 @@
+import asyncio
 import config
+import functools
 import ipaddress
 import logging
 import random
 import string
+import threading
 
 from datetime import datetime
-from pytz import timezone
-from typing import Any, List
+from typing import Any, Dict, List
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger("shared")
 
-random_suffix = "".join(
-    random.choices(string.ascii_lowercase + string.digits, k=6)
-)
 timestamp_fmt = "%Y-%m-%dT%H:%M:%S %Z"
 timestamp_fmt_short = "%d/%m/%Y %H:%M:%S %Z"
 
-application_timezone = config.active.options.get("timezone")
+application_timezone = ZoneInfo(config.active.options.get("timezone"))
+
+# Event loop runners kept per thread, see run_async
+_runners = threading.local()
 
 
 def fetch_timestamp(short: bool = False):
     """Return a localized, formatted timestamp using datetime.now()"""
-    now = datetime.now()
-    localized = timezone(application_timezone).localize(now)
-    if short:
-        return localized.strftime(timestamp_fmt_short)
-    return localized.strftime(timestamp_fmt)
+    now = datetime.now(application_timezone)
+    return now.strftime(timestamp_fmt_short if short else timestamp_fmt)
 
 
 def fetch_timestamp_from_time_obj(t: datetime):
     """Return a localized, formatted timestamp using datetime.datetime class"""
-    return timezone(application_timezone).localize(t).strftime(timestamp_fmt)
+    return t.replace(tzinfo=application_timezone).strftime(timestamp_fmt)
 
 
 def find_index_in_list(lst: List, key: Any, value: Any):
     """Takes a list of dictionaries and returns
     the index value if key matches.
+
+    This scans the list on every call. When only the matching item is
+    needed, build a lookup once with index_by instead.
     """
     for i, dic in enumerate(lst):
         if dic[key] == value:
@@ -43,16 +46,53 @@ def find_index_in_list(lst: List, key: Any, value: Any):
     return -1
 
 
+def index_by(lst: List[Dict], key: Any) -> Dict[Any, Dict]:
+    """Takes a list of dictionaries and returns a dictionary
+    mapping each item's value for key to the item itself.
+    """
+    return {dic[key]: dic for dic in lst}
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_ip_address(address: str):
+    """Return an IP address object, parsing each string only once"""
+    return ipaddress.ip_address(address)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_ip_network(subnet: str):
+    """Return an IP network object, parsing each string only once"""
+    return ipaddress.ip_network(subnet, strict=False)
+
+
+def random_suffix() -> str:
+    """Return a random six character suffix, e.g. for generated names"""
+    return "".join(random.choices(string.ascii_lowercase + string.digits, k=6))
+
+
+def run_async(coro):
+    """Run a coroutine to completion from synchronous code
+
+    Unlike asyncio.run, the calling thread's event loop is kept and reused
+    on its next call. Loops are not shared between threads since many
+    coroutines still make blocking calls that would stall other threads.
+    """
+    runner = getattr(_runners, "runner", None)
+    if runner is None:
+        runner = _runners.runner = asyncio.Runner()
+    return runner.run(coro)
+
+
 def validate_ip_address(address: str) -> bool:
     """Validate that a provided string is an IP address"""
     try:
         ipaddress.ip_network(address)
         return True
     except ValueError as error:
-        logger.error(error)
+        logger.debug(error)
         return False
 
 
 def validate_ip_in_subnet(address: str, subnet: str) -> bool:
     """Return whether or not an IP address is within a subnet"""
-    return ipaddress.ip_address(address) in ipaddress.ip_network(subnet)
+    return parse_ip_address(address) in parse_ip_network(subnet)
@@ -2,26 +2,38 @@ import config
 import datetime
 import json
 import logging
+import threading
 
 from bot.exc import IndexNotFoundError
 from bot.models.pg import OperationalData, Session
 from bot.shared import tools
+from cachetools import LRUCache, TTLCache, cached
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import (
+    ConnectionErrorRetryHandler,
+    RateLimitErrorRetryHandler,
+)
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger("slack.client")
 
 # Initialize Slack clients
-slack_web_client = WebClient(token=config.slack_bot_token)
+# The client is shared by every handler and rate limits apply per token,
+# so bursts of calls (e.g. while creating an incident) wait and retry
+# when Slack returns 429 instead of failing outright
+slack_web_client = WebClient(
+    token=config.slack_bot_token,
+    retry_handlers=[
+        ConnectionErrorRetryHandler(max_retry_count=2),
+        RateLimitErrorRetryHandler(max_retry_count=2),
+    ],
+)
 
 """
 Reusable variables
 """
-all_workspace_groups = (
-    slack_web_client.usergroups_list() if not config.is_test_environment else []
-)
 bot_user_id = (
     slack_web_client.auth_test().get("user_id")
     if not config.is_test_environment
@@ -41,23 +53,71 @@ slack_workspace_id = (
 # Users to skip invites for
 skip_invite_for_users = ["api", "web"]
 
+# User group membership changes rarely, so lookups are cached for this
+# many seconds to spare a Slack API call per group per incident
+usergroup_cache_ttl = 600
+# Channels are rarely renamed, so names looked up per event are cached
+channel_name_cache_ttl = 3600
+
+
+@cached(
+    cache=TTLCache(maxsize=1, ttl=usergroup_cache_ttl), lock=threading.Lock()
+)
+def get_workspace_groups() -> List[Dict[str, Any]]:
+    """Return the user groups in the Slack workspace"""
+    if config.is_test_environment:
+        return []
+    return slack_web_client.usergroups_list().get("usergroups")
+
+
+@cached(
+    cache=TTLCache(maxsize=1, ttl=usergroup_cache_ttl), lock=threading.Lock()
+)
+def get_usergroup_ids() -> Dict[str, str]:
+    """Return a mapping of Slack user group handles to their IDs"""
+    return {g["handle"]: g["id"] for g in get_workspace_groups()}
+
+
+@cached(
+    cache=TTLCache(maxsize=64, ttl=usergroup_cache_ttl), lock=threading.Lock()
+)
+def get_usergroup_members(handle: str) -> List[str]:
+    """Return the IDs of the members of a Slack user group by handle
+
+    Returns an empty list if there is no group with that handle
+    """
+    group_id = get_usergroup_ids().get(handle)
+    if group_id is None:
+        logger.error(f"Couldn't find group {handle}")
+        return []
+    return slack_web_client.usergroups_users_list(usergroup=group_id).get(
+        "users"
+    )
+
+
+def clear_usergroup_caches():
+    """Forget cached user groups and their members"""
+    get_workspace_groups.cache_clear()
+    get_usergroup_ids.cache_clear()
+    get_usergroup_members.cache_clear()
+
 
 def check_user_in_group(user_id: str, group_name: str) -> bool:
     """Provided a user ID and a group name, return a bool indicating
     whether or not the user is in the group.
+
+    This gates access, so membership is always looked up live rather than
+    through the get_usergroup_members cache
     """
-    all_groups = all_workspace_groups.get("usergroups")
     try:
-        target_group = [g for g in all_groups if g["handle"] == group_name]
-        if len(target_group) == 0:
+        group_id = get_usergroup_ids().get(group_name)
+        if group_id is None:
             logger.error(f"Couldn't find group {group_name}")
             return False
-        target_group_members = slack_web_client.usergroups_users_list(
-            usergroup=target_group[0].get("id"),
+        members = slack_web_client.usergroups_users_list(
+            usergroup=group_id,
         ).get("users")
-        if user_id in target_group_members:
-            return True
-        return False
+        return user_id in members
     except Exception as error:
         logger.error(f"Error looking for user {user_id} in group {group_name}: {error}")
 
@@ -97,26 +157,64 @@ def get_channel_history(channel_id: str) -> str:
     return json.dumps(history_dict_reversed)
 
 
+@cached(
+    cache=TTLCache(maxsize=1, ttl=channel_name_cache_ttl),
+    lock=threading.Lock(),
+)
+def get_channel_indexes() -> Dict[str, Dict[str, Dict]]:
+    """Return the workspace's channels indexed by both id and name"""
+    channels = return_slack_channel_info()
+    return {
+        "id": tools.index_by(channels, "id"),
+        "name": tools.index_by(channels, "name"),
+    }
+
+
+def find_channel(key: str, value: str) -> Optional[Dict]:
+    """Return the channel whose key ("id" or "name") matches value
+
+    The cached channel list is refreshed once on a miss since the channel
+    may be newer than the list
+    """
+    channel = get_channel_indexes()[key].get(value)
+    if channel is None:
+        get_channel_indexes.cache_clear()
+        channel = get_channel_indexes()[key].get(value)
+    return channel
+
+
 def get_channel_name(channel_id: str) -> str:
     # Get channel name by id
-    channels = return_slack_channel_info()
-    index = tools.find_index_in_list(channels, "id", channel_id)
-    if index == -1:
+    channel = find_channel("id", channel_id)
+    if channel is None:
         raise IndexNotFoundError(
             "Could not find index for channel in Slack conversations list"
         )
-    return channels[index].get("name")
+    return channel.get("name")
+
+
+@cached(
+    cache=TTLCache(maxsize=1024, ttl=channel_name_cache_ttl),
+    lock=threading.Lock(),
+)
+def lookup_channel_name(channel_id: str) -> str:
+    """Return the name of a channel using conversations.info
+
+    Unlike get_channel_name, this makes a single call for the one channel
+    and is cached, so it suits per-event lookups
+    """
+    channel = slack_web_client.conversations_info(channel=channel_id)
+    return channel["channel"]["name"]
 
 
 def get_digest_channel_id() -> str:
     # Get channel id of the incidents digest channel to send updates to
-    channels = return_slack_channel_info()
-    index = tools.find_index_in_list(channels, "name", config.active.digest_channel)
-    if index == -1:
+    channel = find_channel("name", config.active.digest_channel)
+    if channel is None:
         raise IndexNotFoundError(
             "Could not find index for digest channel in Slack conversations list"
         )
-    return channels[index].get("id")
+    return channel.get("id")
 
 
 def get_formatted_channel_history(channel_id: str, channel_name: str) -> str:
@@ -164,12 +262,15 @@ def get_message_content(conversation_id: str, ts: str):
         logger.error(f"Error retrieving Slack message: {error}")
 
 
+@cached(cache=LRUCache(maxsize=4096), lock=threading.Lock())
 def get_user_name(user_id: str) -> str:
     """
     Get a single user's real_name from a user ID
 
     This is done against the local database so it won't work unless the job to store
     slack user data has been run
+
+    Results are cached until the stored user list is next refreshed
     """
     ulist = Session.query(OperationalData).filter_by(id="slack_users").one()
     for obj in ulist.json_data:
@@ -260,6 +361,7 @@ def store_slack_user_list():
 
         Session.add(row)
         Session.commit()
+        get_user_name.cache_clear()
         logger.info("Stored current Slack users in database...")
     except Exception as error:
         logger.error(f"Opdata row create failed for slack_users: {error}")
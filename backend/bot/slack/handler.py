@@ -1,6 +1,6 @@
-import asyncio
 import config
 import logging
+import re
 import requests
 import slack_sdk
 import variables
@@ -8,25 +8,24 @@ import variables
 from bot.exc import ConfigurationError
 from bot.incident import actions as inc_actions, incident
 from bot.incident.action_parameters import ActionParametersSlack
-from bot.models.incident import db_read_all_incidents
-from bot.scheduler import scheduler
 from bot.shared import tools
 from bot.slack.client import (
+    clear_usergroup_caches,
     get_user_name,
+    lookup_channel_name,
     slack_web_client,
-    slack_workspace_id,
 )
 from bot.slack.helpers import DigestMessageTracking
-from bot.slack.incident_logging import write as write_content
-from bot.slack.messages import (
-    help_menu,
-    incident_list_message,
-    job_list_message,
-    pd_on_call_message,
+from bot.slack.incident_logging import (
+    write as write_content,
+    write_many as write_contents,
 )
+from bot.slack.mentions import run_mention_command
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from slack_bolt import App
 from slack_sdk.errors import SlackApiError
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 logger = logging.getLogger("slack.handler")
 
@@ -44,6 +43,28 @@ from . import modals
 
 tracking = DigestMessageTracking()
 
+# Pinned files are downloaded over one pooled session so that connections
+# to Slack are kept alive between downloads
+slack_file_download_chunk_size = 64 * 1024
+slack_file_download_timeout = 30
+slack_file_download_workers = 8
+pinned_content_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="pinned-content"
+)
+pinned_file_executor = ThreadPoolExecutor(
+    max_workers=slack_file_download_workers, thread_name_prefix="pinned-file"
+)
+slack_file_session = requests.Session()
+slack_file_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=10, pool_maxsize=slack_file_download_workers),
+)
+slack_file_session.headers["Authorization"] = (
+    f"Bearer {config.slack_bot_token}"
+)
+# Pinned images are stored in the database, so very large files are refused
+pinned_image_max_size = 20 * 1024 * 1024
+
 """
 Handle Mentions
 """
@@ -51,61 +72,12 @@ Handle Mentions
 
 @app.event("app_mention")
 def handle_mention(body, say, logger):
-    message = body["event"]["text"].split(" ")
-    user = body["event"]["user"]
     logger.debug(body)
-
-    if "help" in message:
-        say(blocks=help_menu(), text="")
-    elif "diag" in message:
-        startup_message = config.startup_message(
-            workspace=slack_workspace_id, wrap=True
-        )
-        say(channel=user, text=startup_message)
-    elif "lsoi" in message:
-        database_data = db_read_all_incidents()
-        resp = incident_list_message(database_data, all=False)
-        say(blocks=resp, text="")
-    elif "lsai" in message:
-        database_data = db_read_all_incidents()
-        resp = incident_list_message(database_data, all=True)
-        say(blocks=resp, text="")
-    elif "pager" in message:
-        if "pagerduty" in config.active.integrations:
-            from bot.pagerduty import api as pd_api
-
-            pd_oncall_data = pd_api.find_who_is_on_call()
-            resp = pd_on_call_message(data=pd_oncall_data)
-            say(blocks=resp, text="")
-        else:
-            say(
-                text="The PagerDuty integration is not enabled. I cannot provide information from PagerDuty as a result."
-            )
-    elif "scheduler" in message:
-        if message[2] == "list":
-            jobs = scheduler.process.list_jobs()
-            resp = job_list_message(jobs)
-            say(blocks=resp, text="")
-        elif message[2] == "delete":
-            if len(message) < 4:
-                say(text="Please provide the ID of a job to delete.")
-            else:
-                job_title = message[3]
-                delete_job = scheduler.process.delete_job(job_title)
-                if delete_job != None:
-                    say(f"Could not delete the job {job_title}: {delete_job}")
-                else:
-                    say(f"Deleted job: *{job_title}*")
-    elif "ping" in message:
-        say(text="pong")
-    elif "version" in message:
-        say(text=f"I am currently running version: {config.__version__}")
-    elif len(message) == 1:
-        # This is just a user mention and the bot shouldn't really do anything.
-        pass
-    else:
-        resp = " ".join(message[1:])
-        say(text=f"Sorry, I don't know the command *{resp}* yet.")
+    run_mention_command(
+        message=body["event"]["text"].split(),
+        say=say,
+        user=body["event"]["user"],
+    )
 
 
 """
@@ -129,7 +101,9 @@ def parse_action(body) -> Dict[str, Any]:
 def handle_incident_export_chat_logs(ack, body):
     logger.debug(body)
     ack()
-    asyncio.run(inc_actions.export_chat_logs(action_parameters=parse_action(body)))
+    tools.run_async(
+        inc_actions.export_chat_logs(action_parameters=parse_action(body))
+    )
 
 
 @app.action("incident.add_on_call_to_channel")
@@ -147,7 +121,7 @@ def handle_incident_add_on_call(ack, body, say):
 def handle_incident_archive_incident_channel(ack, body):
     logger.debug(body)
     ack()
-    asyncio.run(
+    tools.run_async(
         inc_actions.archive_incident_channel(action_parameters=parse_action(body))
     )
 
@@ -156,28 +130,36 @@ def handle_incident_archive_incident_channel(ack, body):
 def handle_incident_assign_role(ack, body):
     logger.debug(body)
     ack()
-    asyncio.run(inc_actions.assign_role(action_parameters=parse_action(body)))
+    tools.run_async(
+        inc_actions.assign_role(action_parameters=parse_action(body))
+    )
 
 
 @app.action("incident.claim_role")
 def handle_incident_claim_role(ack, body):
     logger.debug(body)
     ack()
-    asyncio.run(inc_actions.claim_role(action_parameters=parse_action(body)))
+    tools.run_async(
+        inc_actions.claim_role(action_parameters=parse_action(body))
+    )
 
 
 @app.action("incident.set_status")
 def handle_incident_set_status(ack, body):
     logger.debug(body)
     ack()
-    asyncio.run(inc_actions.set_status(action_parameters=parse_action(body)))
+    tools.run_async(
+        inc_actions.set_status(action_parameters=parse_action(body))
+    )
 
 
 @app.action("incident.set_severity")
 def handle_incident_set_severity(ack, body):
     logger.debug(body)
     ack()
-    asyncio.run(inc_actions.set_severity(action_parameters=parse_action(body)))
+    tools.run_async(
+        inc_actions.set_severity(action_parameters=parse_action(body))
+    )
 
 
 """
@@ -191,283 +173,392 @@ def reaction_added(event, say):
     channel_id = event["item"]["channel"]
     ts = event["item"]["ts"]
     # Automatically create incident based on reaction with specific emoji
-    if emoji == config.active.options.get("create_from_reaction").get(
-        "reacji"
-    ) and config.active.options.get("create_from_reaction").get("enabled"):
-        # Retrieve the content of the message that was reacted to
-        try:
-            result = slack_web_client.conversations_history(
-                channel=channel_id, inclusive=True, oldest=ts, limit=1
-            )
-            message = result["messages"][0]
-            message_reacted_to_content = message["text"]
-        except Exception as error:
-            logger.error(f"Error when trying to retrieve a message: {error}")
-        # Create request parameters object
-        try:
-            request_parameters = incident.RequestParameters(
-                channel=channel_id,
-                incident_description=f"auto-{tools.random_suffix}",
-                user="internal_auto_create",
-                severity="sev4",
-                message_reacted_to_content=message_reacted_to_content,
-                original_message_timestamp=ts,
-                is_security_incident=False,
-                private_channel=False,
-            )
-        except ConfigurationError as error:
-            logger.error(error)
-        # Create an incident based on the message using the internal path
-        try:
-            incident.create_incident(
-                internal=True, request_parameters=request_parameters
-            )
-        except Exception as error:
-            logger.error(f"Error when trying to create an incident: {error}")
+    create_from_reaction = (
+        config.active.options.get("create_from_reaction") or {}
+    )
+    if create_from_reaction.get(
+        "enabled"
+    ) and emoji == create_from_reaction.get("reacji"):
+        create_incident_from_reaction(channel_id, ts)
     # Pinned content for incidents
     if emoji == "pushpin":
-        channel_info = slack_web_client.conversations_info(channel=channel_id)
-        if "inc-" in channel_info["channel"]["name"]:
-            # Retrieve the content of the message that was reacted to
-            try:
-                result = slack_web_client.conversations_history(
-                    channel=channel_id, inclusive=True, oldest=ts, limit=1
-                )
-                message = result["messages"][0]
-                if "files" in message:
-                    for file in message["files"]:
-                        if "image" in file["mimetype"]:
-                            if not file["public_url_shared"]:
-                                # Make the attachment public temporarily
-                                try:
-                                    slack_web_client.files_sharedPublicURL(
-                                        file=file["id"],
-                                        token=config.slack_user_token,
-                                    )
-                                except SlackApiError as error:
-                                    logger.error(
-                                        f"Error preparing pinned file for copy: {error}"
-                                    )
-                            # Copy the attachment into the database
-                            pub_secret = file["permalink_public"].split("-")[3]
-                            res = requests.get(
-                                file["url_private"],
-                                headers={
-                                    "Authorization": f"Bearer {config.slack_bot_token}"
-                                },
-                                params={"pub_secret": pub_secret},
-                            )
-                            write_content(
-                                incident_id=channel_info["channel"]["name"],
-                                title=file["name"],
-                                img=res.content,
-                                mimetype=file["mimetype"],
-                                ts=tools.fetch_timestamp(short=True),
-                                user=get_user_name(user_id=message["user"]),
-                            )
-                            # Revoke public access
-                            try:
-                                slack_web_client.files_revokePublicURL(
-                                    file=file["id"],
-                                    token=config.slack_user_token,
-                                )
-                            except SlackApiError as error:
-                                logger.error(
-                                    f"Error preparing pinned file for copy: {error}"
-                                )
-                        else:
-                            say(
-                                channel=channel_id,
-                                text=f":wave: Hey there! It looks like that's not an image. I can currently only attach images.",
-                            )
-                else:
-                    write_content(
-                        incident_id=channel_info["channel"]["name"],
-                        content=message["text"],
-                        ts=tools.fetch_timestamp(short=True),
-                        user=get_user_name(user_id=message["user"]),
-                    )
-            except Exception as error:
-                logger.error(f"Error when trying to retrieve a message: {error}")
-            finally:
-                try:
-                    slack_web_client.reactions_add(
-                        channel=channel_id,
-                        name="white_check_mark",
-                        timestamp=ts,
-                    )
-                except Exception as error:
-                    if "already_reacted" in str(error):
-                        reason = "It looks like I've already pinned that content."
-                    else:
-                        reason = f"Something went wrong: {error}"
-                    say(
-                        channel=channel_id,
-                        text=f":wave: Hey there! I was unable to pin that message. {reason}",
-                    )
+        # Copying pinned content makes several Slack calls and database writes,
+        # so it is handed off to keep this listener free for other events
+        task = pinned_content_executor.submit(
+            store_pinned_content, channel_id, ts, say
+        )
+        task.add_done_callback(log_pinned_content_error)
 
 
-"""
-Helper Functions
-"""
+def log_pinned_content_error(task: Future):
+    """
+    Log an error raised while storing pinned content
 
+    The task runs outside of Bolt, so its errors never reach app.error
+    """
+    error = task.exception()
+    if error is not None:
+        logger.error(
+            f"Error when trying to store pinned content: {error}",
+            exc_info=error,
+        )
 
-@app.event("message")
-def handle_message_events(body, logger):
-    logger.debug(body)
+
+def create_incident_from_reaction(channel_id: str, ts: str):
     """
-    Handle monitoring digest channel
+    Create an incident from a message that was reacted to
     """
-    if (
-        # The presence of subtype indicates events like message updates, etc.
-        # We don't want to act on these.
-        body["event"]["channel"] == variables.digest_channel_id
-        and not "subtype" in body["event"].keys()
-    ):
-        tracking.incr()
-        if tracking.calls > 3:
-            try:
-                result = slack_web_client.chat_postMessage(
-                    channel=body["event"]["channel"],
-                    blocks=[
-                        {
-                            "block_id": "chatter_help_message",
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": ":wave: Hey there! I've noticed there's some conversation happening in this channel and that there are no active incidents. "
-                                + "You can always start an incident and use it to investigate. In fact, all incidents start off as investigations! "
-                                + "You can always mark things as resolved if there are no actual issues.",
-                            },
-                        },
-                        {"type": "divider"},
-                        {
-                            "type": "actions",
-                            "block_id": "chat_help_message_buttons",
-                            "elements": [
-                                {
-                                    "type": "button",
-                                    "text": {
-                                        "type": "plain_text",
-                                        "text": "Start New Incident",
-                                        "emoji": True,
-                                    },
-                                    "value": "show_incident_modal",
-                                    "action_id": "open_incident_modal",
-                                    "style": "danger",
-                                },
-                                {
-                                    "type": "button",
-                                    "text": {
-                                        "type": "plain_text",
-                                        "text": "Dismiss",
-                                        "emoji": True,
-                                    },
-                                    "value": "placeholder",
-                                    "action_id": "dismiss_message",
-                                },
-                            ],
-                        },
-                    ],
-                )
-                tracking.reset()
-                tracking.set_message_ts(message_ts=result["message"]["ts"])
-                # Retrieve the sent message
-                sent_message = slack_web_client.conversations_history(
-                    channel=body["event"]["channel"],
-                    inclusive=True,
-                    oldest=result["message"]["ts"],
-                    limit=1,
+    # Retrieve the content of the message that was reacted to
+    try:
+        result = slack_web_client.conversations_history(
+            channel=channel_id, inclusive=True, oldest=ts, limit=1
+        )
+        message = result["messages"][0]
+        message_reacted_to_content = message["text"]
+    except Exception as error:
+        logger.error(f"Error when trying to retrieve a message: {error}")
+        return
+    # Create request parameters object
+    try:
+        request_parameters = incident.RequestParameters(
+            channel=channel_id,
+            incident_description=f"auto-{tools.random_suffix()}",
+            user="internal_auto_create",
+            severity="sev4",
+            message_reacted_to_content=message_reacted_to_content,
+            original_message_timestamp=ts,
+            is_security_incident=False,
+            private_channel=False,
+        )
+    except ConfigurationError as error:
+        logger.error(error)
+        return
+    # Create an incident based on the message using the internal path
+    try:
+        tools.run_async(
+            incident.create_incident(
+                internal=True, request_parameters=request_parameters
+            )
+        )
+    except Exception as error:
+        logger.error(f"Error when trying to create an incident: {error}")
+
+
+def store_pinned_content(channel_id: str, ts: str, say):
+    """
+    Store a message pinned with a reaction in an incident channel
+    """
+    try:
+        channel_name = lookup_channel_name(channel_id)
+    except SlackApiError as error:
+        logger.error(
+            f"Error when trying to look up channel {channel_id}: {error}"
+        )
+        return
+    if not channel_name.startswith("inc-"):
+        return
+    # Retrieve the content of the message that was reacted to
+    try:
+        result = slack_web_client.conversations_history(
+            channel=channel_id, inclusive=True, oldest=ts, limit=1
+        )
+        message = result["messages"][0]
+        # Everything stored from this pin shares one timestamp and author
+        pinned_at = tools.fetch_timestamp(short=True)
+        user_name = get_user_name(user_id=message["user"])
+        if "files" in message:
+            # Sort the files in one pass and reply once per kind of problem
+            images, non_images, too_large = [], [], []
+            for file in message["files"]:
+                if "image" not in file["mimetype"]:
+                    non_images.append(file)
+                elif file.get("size", 0) > pinned_image_max_size:
+                    too_large.append(file)
+                else:
+                    images.append(file)
+            if non_images:
+                names = ", ".join(f["name"] for f in non_images)
+                say(
+                    channel=channel_id,
+                    text=f":wave: Hey there! It looks like these files aren't images: {names}. I can currently only attach images.",
                 )
-                # Update the sent message with its own timestamp
-                existing_blocks = sent_message["messages"][0]["blocks"]
-                existing_blocks[2]["elements"][1]["value"] = result["message"]["ts"]
-                try:
-                    slack_web_client.chat_update(
-                        channel=body["event"]["channel"],
-                        ts=result["message"]["ts"],
-                        blocks=existing_blocks,
-                        text="",
+            # Images are independent of one another, so copy them concurrently
+            copies = {
+                pinned_file_executor.submit(
+                    copy_pinned_image, file=file, ts=pinned_at, user=user_name
+                ): file
+                for file in images
+            }
+            # Report every failed copy rather than only the first
+            items = []
+            for copy in as_completed(copies):
+                if copy.exception() is not None:
+                    logger.error(
+                        f"Error copying pinned file {copies[copy]['name']}: {copy.exception()}"
                     )
-                except slack_sdk.errors.SlackApiError as error:
-                    logger.error(f"Error updating message: {error}")
-            except slack_sdk.errors.SlackApiError as error:
-                logger.error(
-                    f"Error sending help message to incident channel during increased chatter: {error}"
+                elif copy.result() is None:
+                    # The download went over the limit part way through
+                    too_large.append(copies[copy])
+                else:
+                    items.append(copy.result())
+            # Store all of the images in one transaction
+            write_contents(incident_id=channel_name, items=items)
+            if too_large:
+                names = ", ".join(f["name"] for f in too_large)
+                say(
+                    channel=channel_id,
+                    text=f":wave: Hey there! These images are too large for me to attach: {names}. The limit is {pinned_image_max_size // (1024 * 1024)} MB.",
                 )
+        else:
+            write_content(
+                incident_id=channel_name,
+                content=message["text"],
+                ts=pinned_at,
+                user=user_name,
+            )
+    except Exception as error:
+        logger.error(f"Error when trying to retrieve a message: {error}")
+    finally:
+        try:
+            slack_web_client.reactions_add(
+                channel=channel_id,
+                name="white_check_mark",
+                timestamp=ts,
+            )
+        except Exception as error:
+            if "already_reacted" in str(error):
+                reason = "It looks like I've already pinned that content."
+            else:
+                reason = f"Something went wrong: {error}"
+            say(
+                channel=channel_id,
+                text=f":wave: Hey there! I was unable to pin that message. {reason}",
+            )
 
 
-"""
-Statuspage
-"""
-
-
-@app.action("statuspage.components_select")
-def handle_static_action(ack, body):
-    logger.debug(body)
-    ack()
-
-
-@app.action("statuspage.components_status_select")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("statuspage.impact_select")
-def handle_static_action(ack, body):
-    logger.debug(body)
-    ack()
+def copy_pinned_image(
+    file: Dict[str, Any], ts: str, user: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Copy a pinned image from Slack, returning it as an item to store with
+    write_contents, or None if it is larger than pinned_image_max_size
+    """
+    if not file["public_url_shared"]:
+        # Make the attachment public temporarily
+        try:
+            slack_web_client.files_sharedPublicURL(
+                file=file["id"],
+                token=config.slack_user_token,
+            )
+        except SlackApiError as error:
+            logger.error(f"Error preparing pinned file for copy: {error}")
+    try:
+        # Copy the attachment
+        pub_secret = file["permalink_public"].rsplit("-", 1)[-1]
+        img = download_pinned_image(
+            url=file["url_private"], pub_secret=pub_secret
+        )
+        if img is None:
+            return None
+        return {
+            "title": file["name"],
+            "img": img,
+            "mimetype": file["mimetype"],
+            "ts": ts,
+            "user": user,
+        }
+    finally:
+        # Revoke public access
+        try:
+            slack_web_client.files_revokePublicURL(
+                file=file["id"],
+                token=config.slack_user_token,
+            )
+        except SlackApiError as error:
+            logger.error(f"Error preparing pinned file for copy: {error}")
 
 
-@app.action("statuspage.open_statuspage")
-def handle_static_action(ack, body):
-    logger.debug(body)
-    ack()
+def download_pinned_image(url: str, pub_secret: str) -> Optional[bytearray]:
+    """
+    Download a pinned image in chunks, giving up on anything larger than
+    pinned_image_max_size rather than holding all of it in memory
+    """
+    content = bytearray()
+    with slack_file_session.get(
+        url,
+        params={"pub_secret": pub_secret},
+        stream=True,
+        timeout=slack_file_download_timeout,
+    ) as res:
+        for chunk in res.iter_content(
+            chunk_size=slack_file_download_chunk_size
+        ):
+            content.extend(chunk)
+            if len(content) > pinned_image_max_size:
+                logger.error(
+                    f"Pinned image at {url} is larger than {pinned_image_max_size} bytes, skipping"
+                )
+                return None
+    # Returned as is, since converting to bytes would copy the whole image
+    return content
 
 
-@app.action("statuspage.update_status")
-def handle_static_action(ack, body):
-    logger.debug(body)
-    ack()
+"""
+User Groups
+"""
 
 
-@app.action("statuspage.view_incident")
-def handle_static_action(ack, body):
+@app.event("subteam_created")
+@app.event("subteam_members_changed")
+@app.event("subteam_updated")
+def handle_subteam_events(body):
+    # Cached user group lookups are stale once a group changes
     logger.debug(body)
-    ack()
+    clear_usergroup_caches()
 
 
 """
-Jira
+Helper Functions
 """
 
 
-@app.action("jira.description_input")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
+# How many messages the digest channel can receive before the chatter
+# help message is posted
+chatter_help_threshold = 3
+
+# The chatter help message is the same every time apart from the value
+# of its dismiss button, so the static blocks are built once
+chatter_help_header_blocks = (
+    {
+        "block_id": "chatter_help_message",
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": ":wave: Hey there! I've noticed there's some conversation happening in this channel and that there are no active incidents. "
+            + "You can always start an incident and use it to investigate. In fact, all incidents start off as investigations! "
+            + "You can always mark things as resolved if there are no actual issues.",
+        },
+    },
+    {"type": "divider"},
+)
+chatter_help_start_button = {
+    "type": "button",
+    "text": {
+        "type": "plain_text",
+        "text": "Start New Incident",
+        "emoji": True,
+    },
+    "value": "show_incident_modal",
+    "action_id": "open_incident_modal",
+    "style": "danger",
+}
+
+
+def chatter_help_buttons(dismiss_value: str) -> Dict[str, Any]:
+    return {
+        "type": "actions",
+        "block_id": "chat_help_message_buttons",
+        "elements": [
+            chatter_help_start_button,
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "Dismiss",
+                    "emoji": True,
+                },
+                "value": dismiss_value,
+                "action_id": "dismiss_message",
+            },
+        ],
+    }
 
 
-@app.action("jira.priority_select")
-def handle_static_action(ack, body):
+@app.event("message")
+def handle_message_events(body, logger):
     logger.debug(body)
-    ack()
-
+    """
+    Handle monitoring digest channel
+    """
+    event = body["event"]
+    # This fires for every message the bot can see, so anything outside the
+    # digest channel is dropped first. The presence of subtype indicates
+    # events like message updates, etc. We don't want to act on these.
+    if (
+        event.get("channel") != variables.digest_channel_id
+        or "subtype" in event
+    ):
+        return
+    # Only the message that crosses the threshold posts help
+    if not tracking.crossed(chatter_help_threshold):
+        return
+    blocks = [
+        *chatter_help_header_blocks,
+        chatter_help_buttons(dismiss_value="placeholder"),
+    ]
+    try:
+        result = slack_web_client.chat_postMessage(
+            channel=event["channel"],
+            blocks=blocks,
+        )
+        tracking.set_message_ts(message_ts=result["message"]["ts"])
+        # Update the sent message with its own timestamp so the
+        # dismiss button knows which message to delete
+        blocks[2] = chatter_help_buttons(dismiss_value=result["message"]["ts"])
+        try:
+            slack_web_client.chat_update(
+                channel=event["channel"],
+                ts=result["message"]["ts"],
+                blocks=blocks,
+                text="",
+            )
+        except slack_sdk.errors.SlackApiError as error:
+            logger.error(f"Error updating message: {error}")
+    except slack_sdk.errors.SlackApiError as error:
+        logger.error(
+            f"Error sending help message to incident channel during increased chatter: {error}"
+        )
 
-@app.action("jira.summary_input")
-def handle_static_action(ack, body):
-    logger.debug(body)
-    ack()
 
+"""
+Actions that only need to be acknowledged
+"""
 
-@app.action("jira.type_select")
-def handle_static_action(ack, body):
-    logger.debug(body)
-    ack()
+static_actions = (
+    # Statuspage
+    "statuspage.components_select",
+    "statuspage.components_status_select",
+    "statuspage.impact_select",
+    "statuspage.open_statuspage",
+    "statuspage.update_status",
+    "statuspage.view_incident",
+    # Jira
+    "jira.description_input",
+    "jira.priority_select",
+    "jira.summary_input",
+    "jira.type_select",
+    "jira.view_issue",
+    # Links and selections handled elsewhere
+    "incident.incident_postmortem_link",
+    "incident.click_conference_bridge_link",
+    "incident.incident_guide_link",
+    "incident.join_incident_channel",
+    "external.reload",
+    "external.view_status_page",
+    "incident_update_modal_select_incident",
+    "open_rca",
+    "open_incident_modal_set_severity",
+    "open_incident_modal_set_security_type",
+    "open_incident_modal_set_private",
+    "view_statuspage_incident",
+)
 
 
-@app.action("jira.view_issue")
+# One listener matched against a single compiled pattern instead of one
+# listener per action ID
+@app.action(
+    re.compile("^(?:" + "|".join(map(re.escape, static_actions)) + ")$")
+)
 def handle_static_action(ack, body):
     logger.debug(body)
     ack()
@@ -488,75 +579,3 @@ def handle_dismiss_message(ack, body):
         )
     except slack_sdk.errors.SlackApiError as error:
         logger.error(f"Error deleting message: {error}")
-
-
-@app.action("incident.incident_postmortem_link")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("incident.click_conference_bridge_link")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("incident.incident_guide_link")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("incident.join_incident_channel")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("external.reload")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("external.view_status_page")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("incident_update_modal_select_incident")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("open_rca")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("open_incident_modal_set_severity")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("open_incident_modal_set_security_type")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("open_incident_modal_set_private")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
-
-
-@app.action("view_statuspage_incident")
-def handle_static_action(ack, body, logger):
-    logger.debug(body)
-    ack()
@@ -1,3 +1,5 @@
+import itertools
+
 from datetime import datetime
 
 
@@ -5,15 +7,30 @@ class DigestMessageTracking:
     def __init__(self):
         self.start = datetime.now()
         self.ts = datetime.now()
-        self.calls = 0
+        # next() on an itertools.count is atomic, so messages handled on
+        # different threads are counted without taking a lock
+        self.counter = itertools.count(1)
         self.message_ts = ""
 
-    def incr(self):
-        self.calls += 1
+    def incr(self) -> int:
+        """Count a message and return the new total"""
         self.ts = datetime.now()
+        return next(self.counter)
+
+    def crossed(self, threshold: int) -> bool:
+        """Count a message and return True only for the message that takes
+        the total past threshold, starting the count over when it does
+
+        Messages counted on other threads at the same time get False, so
+        only one caller acts on each crossing
+        """
+        if self.incr() != threshold + 1:
+            return False
+        self.reset()
+        return True
 
     def reset(self):
-        self.calls = 0
+        self.counter = itertools.count(1)
 
     def set_message_ts(self, message_ts: str):
         self.message_ts = message_ts
@@ -2,7 +2,7 @@ import logging
 
 from bot.models.pg import IncidentLogging, Session
 from sqlalchemy.orm import scoped_session
-from typing import List
+from typing import Any, Dict, List
 
 logger = logging.getLogger("slack.logging")
 
@@ -70,3 +70,33 @@ def write(
     finally:
         database_session.close()
         database_session.remove()
+
+
+def write_many(
+    incident_id: str,
+    items: List[Dict[str, Any]],
+    database_session: scoped_session = Session,
+):
+    """
+    Write several pinned items for an incident in one transaction
+
+    Each item takes the same fields as write, minus incident_id
+    """
+    if not items:
+        return
+    try:
+        database_session.add_all(
+            [
+                IncidentLogging(incident_id=incident_id, **item)
+                for item in items
+            ]
+        )
+        database_session.commit()
+    except Exception as error:
+        logger.error(
+            f"Audit log row create failed for incident {incident_id}: {error}"
+        )
+        database_session.rollback()
+    finally:
+        database_session.close()
+        database_session.remove()
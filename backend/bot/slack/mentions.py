@@ -0,0 +1,121 @@
+import config
+
+from bot.models.incident import db_read_all_incidents
+from bot.slack.client import slack_workspace_id
+from bot.slack.messages import (
+    help_menu,
+    incident_list_message,
+    job_list_message,
+    pd_on_call_message,
+)
+from typing import List
+
+
+def mention_help(message: List[str], say, user: str):
+    say(blocks=help_menu(), text="")
+
+
+def mention_diag(message: List[str], say, user: str):
+    startup_message = config.startup_message(
+        workspace=slack_workspace_id, wrap=True
+    )
+    say(channel=user, text=startup_message)
+
+
+def mention_lsoi(message: List[str], say, user: str):
+    database_data = db_read_all_incidents()
+    resp = incident_list_message(database_data, all=False)
+    say(blocks=resp, text="")
+
+
+def mention_lsai(message: List[str], say, user: str):
+    database_data = db_read_all_incidents()
+    resp = incident_list_message(database_data, all=True)
+    say(blocks=resp, text="")
+
+
+def mention_pager(message: List[str], say, user: str):
+    if "pagerduty" in config.active.integrations:
+        from bot.pagerduty import api as pd_api
+
+        pd_oncall_data = pd_api.find_who_is_on_call()
+        resp = pd_on_call_message(data=pd_oncall_data)
+        say(blocks=resp, text="")
+    else:
+        say(
+            text="The PagerDuty integration is not enabled. I cannot provide information from PagerDuty as a result."
+        )
+
+
+def mention_scheduler_list(message: List[str], say, user: str):
+    from bot.scheduler import scheduler
+
+    jobs = scheduler.process.list_jobs()
+    resp = job_list_message(jobs)
+    say(blocks=resp, text="")
+
+
+def mention_scheduler_delete(message: List[str], say, user: str):
+    if len(message) < 4:
+        say(text="Please provide the ID of a job to delete.")
+    else:
+        from bot.scheduler import scheduler
+
+        job_title = message[3]
+        delete_job = scheduler.process.delete_job(job_title)
+        if delete_job != None:
+            say(f"Could not delete the job {job_title}: {delete_job}")
+        else:
+            say(f"Deleted job: *{job_title}*")
+
+
+scheduler_commands = {
+    "list": mention_scheduler_list,
+    "delete": mention_scheduler_delete,
+}
+
+
+def mention_scheduler(message: List[str], say, user: str):
+    subcommand = message[2] if len(message) > 2 else ""
+    if subcommand in scheduler_commands:
+        scheduler_commands[subcommand](message, say, user)
+    else:
+        say(
+            text="Please use either *scheduler list* or *scheduler delete <job_id>*."
+        )
+
+
+def mention_ping(message: List[str], say, user: str):
+    say(text="pong")
+
+
+def mention_version(message: List[str], say, user: str):
+    say(text=f"I am currently running version: {config.__version__}")
+
+
+# Commands are the first word after the mention
+mention_commands = {
+    "help": mention_help,
+    "diag": mention_diag,
+    "lsoi": mention_lsoi,
+    "lsai": mention_lsai,
+    "pager": mention_pager,
+    "scheduler": mention_scheduler,
+    "ping": mention_ping,
+    "version": mention_version,
+}
+
+
+def run_mention_command(message: List[str], say, user: str):
+    """Run the command in a mention of the bot, given the words of the
+    message with the mention itself first
+    """
+    if len(message) < 2:
+        # This is just a user mention and the bot shouldn't really do anything.
+        return
+    command = mention_commands.get(message[1])
+    if command is None:
+        resp = " ".join(message[1:])
+        say(text=f"Sorry, I don't know the command *{resp}* yet.")
+    else:
+        command(message, say, user)
@@ -5,7 +5,6 @@ import variables
 from bot.audit.log import read as read_logs, write as write_log
 from bot.exc import ConfigurationError
 from bot.incident import incident
-from bot.jira.issue import JiraIssue
 from bot.models.incident import (
     db_read_all_incidents,
     db_read_incident_channel_id,
@@ -17,8 +16,9 @@ from bot.models.incident import (
 from bot.models.pager import read_pager_auto_page_targets
 from bot.shared import tools
 from bot.slack.client import check_user_in_group
-from bot.slack.handler import app, help_menu
+from bot.slack.handler import app
 from bot.slack.messages import (
+    help_menu,
     incident_list_message,
     pd_on_call_message,
 )
@@ -388,7 +388,7 @@ def handle_submission(ack, body, client):
                 True,
             ),
         )
-        resp = incident.create_incident(request_parameters)
+        resp = tools.run_async(incident.create_incident(request_parameters))
         client.chat_postMessage(channel=user, text=resp)
     except ConfigurationError as error:
         logger.error(error)
@@ -1704,6 +1704,8 @@ def handle_submission(ack, body, client, view):
     Handles open_incident_create_jira_issue_modal
     """
     ack()
+    from bot.jira.issue import JiraIssue
+
     incident_id = body.get("view").get("blocks")[0].get("block_id")
     parsed = parse_modal_values(body)
     try:
@@ -29,6 +29,9 @@ is_test_environment = os.getenv("TEST_ENVIRONMENT", default="false") in (
     True,
 )
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Configuration:
     def __init__(self):
@@ -38,7 +41,7 @@ class Configuration:
             else "config-test.yaml"
         )
         with open(self.filepath, "r") as yamlfile:
-            self.live = yaml.load(yamlfile, Loader=yaml.FullLoader)
+            self.live = yaml.load(yamlfile, Loader=_YamlLoader)
         self.url_regex = "^(?:http(s)?:\/\/)?[\w.-]+(?:\.[\w\.-]+)+[\w\-\._~:/?#[\]@!\$&'\(\)\*\+,;=.]+"
 
     def validate(self):
@@ -78,9 +78,9 @@ def startup_tasks():
     # --------------------
     if "atlassian" in config.active.integrations:
         if "confluence" in config.active.integrations.get("atlassian"):
-            from bot.confluence.api import ConfluenceApi
+            from bot.confluence.api import get_confluence_api
 
-            api_test = ConfluenceApi()
+            api_test = get_confluence_api()
             passes = api_test.test()
             if not passes:
                 logger.fatal(
@@ -96,9 +96,9 @@ def startup_tasks():
                 sys.exit(1)
 
         if "jira" in config.active.integrations.get("atlassian"):
-            from bot.jira.api import JiraApi
+            from bot.jira.api import get_jira_api
 
-            api_test = JiraApi()
+            api_test = get_jira_api()
             passes = api_test.test()
             if not passes:
                 logger.fatal(
@@ -1,10 +1,23 @@
+import asyncio
+import config
+import pytest
 import re
+import slack_sdk.errors
 
+from bot.exc import ConfigurationError
 from bot.incident.action_parameters import (
     ActionParametersSlack,
     ActionParametersWeb,
 )
-from bot.incident.incident import Incident, RequestParameters
+from bot.incident.incident import (
+    Incident,
+    RequestParameters,
+    call_slack,
+    create_incident,
+    incident_description_max_length,
+    recent_message_incidents,
+    reload_config,
+)
 from bot.shared import tools
 from bot.templates.incident.channel_boilerplate import (
     IncidentChannelBoilerplateMessage,
@@ -138,8 +151,45 @@ class TestIncidentManagement:
 
         assert re.search("^inc.*something-has-broken$", inc.channel_name)
 
+        asyncio.run(inc.provision())
+
         assert inc.conference_bridge == "mock"
 
+    def test_incident_provision_skips_conference_on_channel_failure(
+        self, monkeypatch
+    ):
+        meetings = []
+
+        def fail(self):
+            raise slack_sdk.errors.SlackApiError(
+                "name_taken", {"ok": False, "error": "name_taken"}
+            )
+
+        monkeypatch.setattr(config, "is_test_environment", False)
+        monkeypatch.setattr(
+            Incident, "_Incident__create_incident_channel", fail
+        )
+        monkeypatch.setattr(
+            Incident,
+            "_Incident__generate_conference_link",
+            lambda self: meetings.append(self) or "mock",
+        )
+        inc = Incident(
+            request_parameters=RequestParameters(
+                channel="CBR2V3XEX",
+                incident_description="something has broken",
+                user="sample-incident-creator-user",
+                severity="sev4",
+                created_from_web=False,
+                is_security_incident=False,
+            )
+        )
+
+        with pytest.raises(slack_sdk.errors.SlackApiError):
+            asyncio.run(inc.provision())
+
+        assert meetings == []
+
     def test_incident_channel_name_create(self):
         inc = Incident(
             request_parameters=RequestParameters(
@@ -154,6 +204,122 @@ class TestIncidentManagement:
 
         assert re.search("^inc.*unallowed-chracter-check$", inc.channel_name)
 
+        assert re.search("^inc-[0-9]{12}-", inc.channel_name)
+
+    def test_request_parameters_validate(self):
+        with pytest.raises(ConfigurationError):
+            RequestParameters(
+                channel="CBR2V3XEX",
+                incident_description="something has broken",
+                user="sample-incident-creator-user",
+                severity="not-a-severity",
+                created_from_web=False,
+                is_security_incident=False,
+            )
+
+    def test_reload_config_refreshes_severities(self, monkeypatch):
+        monkeypatch.setitem(config.active.live, "severities", {"sev0": "sev0"})
+        try:
+            reload_config()
+            RequestParameters(
+                channel="CBR2V3XEX",
+                incident_description="something has broken",
+                user="sample-incident-creator-user",
+                severity="sev0",
+            )
+            with pytest.raises(ConfigurationError):
+                RequestParameters(
+                    channel="CBR2V3XEX",
+                    incident_description="something has broken",
+                    user="sample-incident-creator-user",
+                    severity="sev4",
+                )
+        finally:
+            monkeypatch.undo()
+            reload_config()
+
+    def test_create_incident_skips_duplicate_message(self, monkeypatch):
+        monkeypatch.setitem(
+            recent_message_incidents, ("CBR2V3XEX", "1610262363.001600"), True
+        )
+
+        resp = asyncio.run(
+            create_incident(
+                request_parameters=RequestParameters(
+                    channel="CBR2V3XEX",
+                    incident_description="auto-mock",
+                    user="internal_auto_create",
+                    severity="sev4",
+                    original_message_timestamp="1610262363.001600",
+                ),
+                internal=True,
+            )
+        )
+
+        assert resp == "An incident has already been created for that message."
+
+    def test_create_incident_rejects_long_description(self):
+        resp = asyncio.run(
+            create_incident(
+                request_parameters=RequestParameters(
+                    channel="CBR2V3XEX",
+                    incident_description="a"
+                    * (incident_description_max_length + 1),
+                    user="internal_auto_create",
+                    severity="sev4",
+                    original_message_timestamp="1610262363.001700",
+                ),
+                internal=True,
+            )
+        )
+
+        assert resp.startswith(
+            "Total channel length cannot exceed 80 characters."
+        )
+        assert (
+            "CBR2V3XEX",
+            "1610262363.001700",
+        ) not in recent_message_incidents
+
+    def test_create_incident_releases_message_on_failure(self, monkeypatch):
+        async def fail(self):
+            raise slack_sdk.errors.SlackApiError("mock", {"ok": False})
+
+        monkeypatch.setattr(Incident, "provision", fail)
+
+        with pytest.raises(slack_sdk.errors.SlackApiError):
+            asyncio.run(
+                create_incident(
+                    request_parameters=RequestParameters(
+                        channel="CBR2V3XEX",
+                        incident_description="auto-mock",
+                        user="internal_auto_create",
+                        severity="sev4",
+                        original_message_timestamp="1610262363.001800",
+                    ),
+                    internal=True,
+                )
+            )
+
+        assert (
+            "CBR2V3XEX",
+            "1610262363.001800",
+        ) not in recent_message_incidents
+
+    def test_call_slack(self):
+        def ok(**kwargs):
+            return {"ok": True, **kwargs}
+
+        def fail(**kwargs):
+            raise slack_sdk.errors.SlackApiError("mock", {"ok": False})
+
+        assert asyncio.run(call_slack("mock", ok, channel="mock")) == {
+            "ok": True,
+            "channel": "mock",
+        }
+
+        assert asyncio.run(call_slack("mock", fail, channel="mock")) is None
+
     def test_incident_build_digest_notification(self):
         assert IncidentChannelDigestNotification.create(
             incident_channel_details={
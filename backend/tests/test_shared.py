@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 
 from bot.shared import tools
@@ -11,6 +12,12 @@ class TestUtils:
         time = datetime.datetime.strptime(ts, tools.timestamp_fmt)
         assert type(time) == datetime.datetime
 
+    def test_fetch_timestamp_from_time_obj(self):
+        ts = tools.fetch_timestamp_from_time_obj(
+            datetime.datetime(2022, 12, 9, 16, 54, 50)
+        )
+        assert ts == "2022-12-09T16:54:50 UTC"
+
     def test_find_index_in_list(self):
         index = tools.find_index_in_list(
             [
@@ -82,6 +89,28 @@ class TestUtils:
         )
         assert index == 1
 
+    def test_index_by(self):
+        channels = [
+            {"id": "C111", "name": "incidents"},
+            {"id": "C222", "name": "inc-202111161200-mock"},
+        ]
+        index = tools.index_by(channels, "id")
+        assert index["C222"] == {"id": "C222", "name": "inc-202111161200-mock"}
+        assert index.get("C333") is None
+
+    def test_random_suffix(self):
+        suffix = tools.random_suffix()
+        assert len(suffix) == 6
+        assert suffix.isalnum()
+
+    def test_run_async(self):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        loop = tools.run_async(current_loop())
+        assert not loop.is_closed()
+        assert tools.run_async(current_loop()) is loop
+
     def test_validate_ip_address(self):
         is_ip = tools.validate_ip_address("127.0.0.1")
         assert is_ip
@@ -0,0 +1,139 @@
+import config
+import importlib
+import pytest
+import sys
+
+from bot.slack import client
+from bot.slack.helpers import DigestMessageTracking
+from bot.slack.mentions import run_mention_command
+from concurrent.futures import Future, ThreadPoolExecutor
+from slack_sdk import WebClient
+
+
+class TestSlackHelpers:
+    def test_digest_message_tracking_incr(self):
+        tracking = DigestMessageTracking()
+
+        assert [tracking.incr() for _ in range(3)] == [1, 2, 3]
+
+        tracking.reset()
+
+        assert tracking.incr() == 1
+
+    def test_digest_message_tracking_crossed(self):
+        tracking = DigestMessageTracking()
+
+        assert [tracking.crossed(3) for _ in range(4)] == [
+            False,
+            False,
+            False,
+            True,
+        ]
+        # The count starts over after crossing
+        assert [tracking.crossed(3) for _ in range(4)] == [
+            False,
+            False,
+            False,
+            True,
+        ]
+
+    def test_digest_message_tracking_crossed_once_across_threads(self):
+        tracking = DigestMessageTracking()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: tracking.crossed(3), range(6))
+            )
+
+        assert results.count(True) == 1
+
+
+class TestSlackMentions:
+    def mention(self, text: str):
+        said = []
+
+        def say(*args, **kwargs):
+            said.append(kwargs.get("text", args[0] if args else None))
+
+        run_mention_command(message=text.split(), say=say, user="U111")
+        return said
+
+    def test_mention_only(self):
+        assert self.mention("<@U222>") == []
+
+    def test_mention_ping(self):
+        assert self.mention("<@U222> ping") == ["pong"]
+
+    def test_mention_version(self):
+        assert self.mention("<@U222>  version") == [
+            f"I am currently running version: {config.__version__}"
+        ]
+
+    def test_mention_unknown_command(self):
+        assert self.mention("<@U222> do something") == [
+            "Sorry, I don't know the command *do something* yet."
+        ]
+
+    def test_mention_command_must_come_first(self):
+        assert self.mention("<@U222> please ping") == [
+            "Sorry, I don't know the command *please ping* yet."
+        ]
+
+    def test_mention_scheduler_without_subcommand(self):
+        assert self.mention("<@U222> scheduler") == [
+            "Please use either *scheduler list* or *scheduler delete <job_id>*."
+        ]
+
+    def test_mention_scheduler_delete_without_job(self):
+        assert self.mention("<@U222> scheduler delete") == [
+            "Please provide the ID of a job to delete."
+        ]
+
+
+class TestSlackHandler:
+    @pytest.fixture
+    def handler(self, monkeypatch):
+        # Slack is not reachable here, so the calls made at import time
+        # answer with a workspace that has the digest channel
+        monkeypatch.setattr(config, "slack_bot_token", "xoxb-valid")
+        monkeypatch.setattr(
+            WebClient,
+            "auth_test",
+            lambda self, **kwargs: {
+                "ok": True,
+                "user_id": "W23456789",
+                "bot_id": "B12345678",
+                "team_id": "T0G9PQBBK",
+            },
+        )
+        monkeypatch.setattr(
+            client,
+            "return_slack_channel_info",
+            lambda: [
+                {"id": "C12345678", "name": config.active.digest_channel}
+            ],
+        )
+        client.get_channel_indexes.cache_clear()
+        for module in ("variables", "bot.slack.handler", "bot.slack.modals"):
+            monkeypatch.delitem(sys.modules, module, raising=False)
+
+        try:
+            yield importlib.import_module("bot.slack.handler")
+        finally:
+            client.get_channel_indexes.cache_clear()
+
+    def test_handler_imports(self, handler):
+        assert handler.modals.app is handler.app
+
+    def test_log_pinned_content_error(self, handler, caplog):
+        done, failed = Future(), Future()
+        done.set_result(None)
+        failed.set_exception(KeyError("user"))
+
+        handler.log_pinned_content_error(done)
+
+        assert caplog.records == []
+
+        handler.log_pinned_content_error(failed)
+
+        assert "Error when trying to store pinned content" in caplog.text
@@ -70,6 +70,9 @@ function renderManifest {
     "      - app_mention" \
     "      - message.channels" \
     "      - reaction_added" \
+    "      - subteam_created" \
+    "      - subteam_members_changed" \
+    "      - subteam_updated" \
     "  interactivity:" \
     "    is_enabled: true" \
     "  org_deploy_enabled: false" \